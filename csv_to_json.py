@@ -6,6 +6,7 @@ import re
 # Directories
 input_dir = "filtered_results"
 output_dir = "articulated_courses_json"
+WRITE_BUFFER_SIZE = 1 << 20  # one large buffer per CC file instead of many small writes
 os.makedirs(output_dir, exist_ok=True)
 
 # Helper to parse course string with units
@@ -105,9 +106,14 @@ for filename in os.listdir(input_dir):
             
             college_json[ccc_key][uc_name][requirement_key] = requirement_data
     
-    # Save per-college JSON
-    with open(output_path, "w", encoding='utf-8') as f:
-        json.dump(college_json, f, indent=2, ensure_ascii=False)
+    # Save per-college JSON (serialize once, then a single buffered write)
+    payload = json.dumps(college_json, indent=2, ensure_ascii=False).encode("utf-8")
+    # written to a temp file and renamed, so an interrupted run never leaves
+    # a half-written JSON for the pathway generator to choke on
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(payload)
+    os.replace(tmp_path, output_path)
     
     print(f"✅ Parsed {filename} → {output_path}")
 
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+common.py
+
+Helpers shared by the pathway_generator modules:
+- load_json / dump_json_bytes (one cached JSON reader and writer for every input file)
+- DEBUG (PATHWAY_DEBUG=1 turns on the per-candidate trace output)
+"""
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson  # optional extra: faster parsing/serializing, same results
+except ImportError:
+    orjson = None
+
+# Per-candidate trace output is only printed when PATHWAY_DEBUG=1; printing
+# it unconditionally dominated the runtime of a plan.
+DEBUG = os.environ.get("PATHWAY_DEBUG") == "1"
+
+
+def load_json(path) -> Any:
+    """
+    Load a JSON file from disk, parsing each distinct file only once per process.
+    The returned object is shared between callers and must not be mutated.
+    """
+    return _load_json_cached(os.path.abspath(path))
+
+@lru_cache(maxsize=None)
+def _load_json_cached(path: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json_bytes(obj) -> bytes:
+    """
+    Serialize obj as 2-space-indented UTF-8 JSON. Non-ASCII text is written
+    as-is rather than \\u-escaped (orjson cannot escape it, so neither does
+    the fallback).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
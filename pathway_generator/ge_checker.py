@@ -3,14 +3,23 @@ class GE_Tracker:
         self.ge_data = ge_data
         self.ge_patterns = {}  # pattern_id -> list of requirements
         self.completed_courses = []
+        # pattern_id -> remaining requirements; cleared whenever courses are added
+        self._remaining_cache = {}
 
     def load_pattern(self, pattern_id: str):
         pattern = next((p for p in self.ge_data["requirementPatterns"] if p["patternId"] == pattern_id), None)
         if pattern:
             self.ge_patterns[pattern_id] = pattern["requirements"]
+            self._remaining_cache.pop(pattern_id, None)
 
     def add_completed_course(self, course_name: str, tags: list):
         self.completed_courses.append({"name": course_name, "tags": tags})
+        self._remaining_cache.clear()
+
+    def add_completed_courses(self, courses):
+        """Add several (course_name, tags) pairs in one call."""
+        self.completed_courses.extend({"name": name, "tags": tags} for name, tags in courses)
+        self._remaining_cache.clear()
 
     def _evaluate_requirement(self, req: dict, completed_courses: list):
         req_id = req["reqId"]
@@ -27,6 +36,17 @@ class GE_Tracker:
         }
 
     def get_remaining_requirements(self, pattern_id: str):
+        """
+        Remaining requirements for pattern_id. The result is cached until the
+        next course is added, so the returned dict is shared and must not be
+        modified.
+        """
+        remaining = self._remaining_cache.get(pattern_id)
+        if remaining is None:
+            remaining = self._remaining_cache[pattern_id] = self._compute_remaining(pattern_id)
+        return remaining
+
+    def _compute_remaining(self, pattern_id: str):
         requirements = self.ge_patterns.get(pattern_id)
         if not requirements:
             return {}
@@ -1,15 +1,24 @@
 # ge_helper.py
 
-import json
-from pathlib import Path
+from functools import lru_cache
+
+from common import load_json
 
 def load_ge_lookup(ge_json_path="ge_reqs.json"):
     """
     Reads the GE requirements file and returns a dict mapping every reqId
     (including subRequirements) to its human-readable name.
+
+    The file never changes during a run, so each path is only read once;
+    the returned dict is shared and must not be modified.
     """
-    ge_path = Path(ge_json_path)
-    data = json.loads(ge_path.read_text())
+    return _load_ge_lookup_cached(str(ge_json_path))
+
+
+@lru_cache(maxsize=None)
+def _load_ge_lookup_cached(ge_json_path):
+    # same cached parse the GE tracker's data comes from
+    data = load_json(ge_json_path)
     lookup = {}
 
     for pattern in data.get("requirementPatterns", []):
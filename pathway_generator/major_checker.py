@@ -11,16 +11,14 @@ Includes:
 - get_cc_to_uc_map (mapping of each UC campus to its receiving courses)
 """
 
-import json
+import os
+import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Set, Tuple
 
-# ─── Low-Level JSON Loader ──────────────────────────────────────────────────
-
-def load_json(path: Path) -> Dict[str, Any]:
-    """Load a JSON file from disk."""
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+from common import load_json
 
 # ─── MajorRequirements Interface ─────────────────────────────────────────────
 
@@ -42,7 +40,8 @@ class MajorRequirements:
             cc_name,
             selected_ucs,
             articulation_dir,
-            course_reqs_path
+            course_reqs_path,
+            group_defs=self.group_defs
         )
 
     def get_remaining_courses(
@@ -83,38 +82,54 @@ class MajorRequirements:
                      articulation_dir: Path
                     ) -> Dict[str, Dict[str, List[List[str]]]]:
         cc_key = format_cc_name(cc_name)           # e.g. "de_anza" → "De_Anza_College"
-        raw = load_json(articulation_dir)          # full JSON
-        data = raw.get(cc_key, {})
 
         uc_to_map: Dict[str, Dict[str, List[List[str]]]] = {}
         for uc in selected_ucs:
-            uc_entries = data.get(uc, {})          # e.g. data["UCB"], data["UCLA"], etc.
-            uc_map: Dict[str, List[List[str]]] = {}
-
-            for req_id, req_obj in uc_entries.items():
-                # normalize receiving_course(s)
-                recs = []
-                if "receiving_course" in req_obj:
-                    recs = [req_obj["receiving_course"]]
-                elif "receiving_courses" in req_obj:
-                    recs = req_obj["receiving_courses"]
-
-                # pull out every OR‐block of AND‐courses
-                # each block = one way (AND) to satisfy → list of strings
-                blocks: List[List[str]] = [
-                    [ course_obj["course"] for course_obj in group ]
-                    for group in req_obj.get("course_groups", [])
-                ]
-
-                # attach every block to *each* receiving course
-                for rec in recs:
-                    uc_map.setdefault(rec, []).extend(blocks)
-
-            uc_to_map[uc] = uc_map
+            # the per-UC walk is cached and shared; callers must not modify it
+            uc_to_map[uc] = get_receiving_course_blocks(str(articulation_dir), cc_key, uc)
         return uc_to_map
 
 # ─── Low-Level Helpers ───────────────────────────────────────────────────────
 
+@lru_cache(maxsize=None)
+def get_receiving_course_blocks(
+    art_path: str,
+    cc_key: str,
+    uc: str
+) -> Dict[str, List[List[str]]]:
+    """
+    Walk one UC's section of an articulation file and map each receiving
+    UC course to its OR-list of AND-blocks of CC courses.
+
+    Cached per (file, CC key, UC) so the same section is only transformed
+    once no matter how many UC combinations include it; treat as read-only.
+    """
+    data = load_json(Path(art_path)).get(cc_key, {})
+    uc_map: Dict[str, List[List[str]]] = {}
+
+    for req_obj in data.get(uc, {}).values():
+        # normalize receiving_course(s)
+        recs = []
+        if "receiving_course" in req_obj:
+            recs = [req_obj["receiving_course"]]
+        elif "receiving_courses" in req_obj:
+            recs = req_obj["receiving_courses"]
+
+        # pull out every OR‐block of AND‐courses
+        # each block = one way (AND) to satisfy → list of strings
+        # (codes interned: they meet the prereq table's codes in set lookups)
+        blocks: List[List[str]] = [
+            [ sys.intern(course_obj["course"]) for course_obj in group ]
+            for group in req_obj.get("course_groups", [])
+        ]
+
+        # attach every block to *each* receiving course
+        for rec in recs:
+            uc_map.setdefault(rec, []).extend(blocks)
+
+    return uc_map
+
+
 def load_uc_requirement_groups(
     course_reqs_path: Path,
     selected_ucs: List[str]
@@ -149,11 +164,26 @@ def get_major_requirements(
     cc_name: str,
     selected_ucs: List[str],
     articulation_dir: str
+) -> MajorRequirements:
+    """
+    MajorRequirements is read-only once built, so every pathway for the same
+    (CC, UC list) shares one instance instead of re-deriving its group maps.
+    """
+    return _get_major_requirements_cached(
+        str(course_reqs_path), cc_name, tuple(selected_ucs), str(articulation_dir)
+    )
+
+@lru_cache(maxsize=None)
+def _get_major_requirements_cached(
+    course_reqs_path: str,
+    cc_name: str,
+    selected_ucs: Tuple[str, ...],
+    articulation_dir: str
 ) -> MajorRequirements:
     return MajorRequirements(
         Path(course_reqs_path),
         cc_name,
-        selected_ucs,
+        list(selected_ucs),
         Path(articulation_dir)
     )
 
@@ -162,26 +192,41 @@ def get_major_requirements(
 
 
 
-def get_articulation_filename(cc_name: str) -> str:
-    """Convert short CC ID to actual articulation filename."""
-    mapping = {
-        "cabrillo": "Cabrillo_College_articulation.json",
-        "chabot": "Chabot_College_articulation.json",
-        "city_college_of_san_francisco": "City_College_Of_San_Francisco_articulation.json",
-        "cosumnes_river": "Cosumnes_River_College_articulation.json",
-        "de_anza": "De_Anza_College_articulation.json",
-        "diablo_valley": "Diablo_Valley_College_articulation.json",
-        "folsom_lake": "Folsom_Lake_College_articulation.json",
-        "foothill": "Foothill_College_articulation.json",
-        "la_city": "Los_Angeles_City_College_articulation.json",
-        "las_positas": "Las_Positas_College_articulation.json",
-        "los_angeles_pierce": "Los_Angeles_Pierce_College_articulation.json",
-        "miracosta": "MiraCosta_College_articulation.json",
-        "mt_san_jacinto": "Mt_San_Jacinto_College_articulation.json",
-        "orange_coast": "Orange_Coast_College_articulation.json",
-        "palomar": "Palomar_College_articulation.json",
-    }
-    return mapping.get(cc_name, f"{cc_name}_articulation.json")
+# Short IDs whose articulation file name cannot be derived from the ID itself.
+CC_NAME_ALIASES = {
+    "la_city": "los_angeles_city",
+}
+
+
+def canon_cc_name(name: str) -> str:
+    """
+    Reduce a CC ID or file stem to a comparable key, so spelling variants
+    line up: "mt_san_jacinto" and "Mt._San_Jacinto_College" → "mtsanjacinto".
+    """
+    name = name.lower().removesuffix("_articulation")
+    return re.sub(r"[^a-z0-9]", "", name.replace("college", ""))
+
+
+@lru_cache(maxsize=None)
+def build_articulation_index(articulation_dir: Path) -> Dict[str, str]:
+    """
+    Map canonical CC name → articulation filename for every file in the directory.
+    Uses one os.scandir pass (no fnmatch, no Path per entry); cached per directory.
+    """
+    suffix = "_articulation.json"
+    with os.scandir(articulation_dir) as entries:
+        return {
+            canon_cc_name(e.name[: -len(".json")]): e.name
+            for e in entries
+            if e.name.endswith(suffix) and e.is_file()
+        }
+
+
+def get_articulation_filename(cc_name: str, articulation_dir: Path) -> str:
+    """Convert short CC ID (or JSON key) to actual articulation filename."""
+    index = build_articulation_index(Path(articulation_dir))
+    key = canon_cc_name(CC_NAME_ALIASES.get(cc_name, cc_name))
+    return index.get(key, f"{cc_name}_articulation.json")
 
 
 def build_uc_block_map(
@@ -189,49 +234,19 @@ def build_uc_block_map(
     selected_ucs: List[str],
     articulation_dir: Path
 ) -> Dict[Tuple[str, str], List[List[str]]]:
-    filename = get_articulation_filename(cc_name)
+    filename = get_articulation_filename(cc_name, articulation_dir)
     path = articulation_dir / filename
-    # print(f"    Debug: Loading articulation file: {path}")
     data = load_json(path)
-    # print(f"    Debug: Loaded data keys: {list(data.keys())}")
-    
+
     # Get the actual CC name from the data (first key)
-    actual_cc_name = list(data.keys())[0] if data else cc_name
-    # print(f"    Debug: Using CC name: {actual_cc_name}")
-    cc_data = data.get(actual_cc_name, {})
-    # print(f"    Debug: CC data keys: {list(cc_data.keys())}")
+    actual_cc_name = next(iter(data), cc_name)
     block_map: Dict[Tuple[str, str], List[List[str]]] = {}
 
     for uc in selected_ucs:
-        uc_data = cc_data.get(uc, {})
-        # print(f"    Debug: Processing {uc}, found {len(uc_data)} entries")
-        for group_name, entry in uc_data.items():
-            # print(f"      Processing {group_name}: {list(entry.keys())}")
-            
-            # Handle both single receiving course and multiple receiving courses
-            recs = []
-            if 'receiving_course' in entry:
-                recs = [entry['receiving_course']]
-            elif 'receiving_courses' in entry:
-                recs = entry['receiving_courses']
-            
-            # print(f"        Receiving courses: {recs}")
-            
-            # Extract course groups
-            course_groups = entry.get('course_groups', [])
-            # print(f"        Course groups: {len(course_groups)} groups")
-            blocks: List[List[str]] = [[c['course'] for c in group] for group in course_groups]
-            # print(f"        Extracted blocks: {blocks}")
-            
-            for r in recs:
-                block_map.setdefault((uc, r), []).extend(blocks)
-                # print(f"        Added to block_map[({uc}, {r})]: {blocks}")
-    
-    # Debug: Print what we found
-    # print(f"  Debug: Found {len(block_map)} entries in block_map")
-    # for (uc, uccode), blocks in block_map.items():
-    #     print(f"    ({uc}, {uccode}): {len(blocks)} blocks")
-    
+        uc_blocks = get_receiving_course_blocks(str(path), actual_cc_name, uc)
+        for r, blocks in uc_blocks.items():
+            block_map[(uc, r)] = list(blocks)
+
     return block_map
 
 
@@ -239,10 +254,13 @@ def build_uc_group_block_map(
     cc_name: str,
     selected_ucs: List[str],
     articulation_dir: Path,
-    course_reqs_path: Path
+    course_reqs_path: Path,
+    group_defs: Dict[str, Dict[str, Dict[str, Any]]] = None
 ) -> Dict[Tuple[str, str], List[List[str]]]:
     block_map  = build_uc_block_map(cc_name, selected_ucs, articulation_dir)
-    group_defs = load_uc_requirement_groups(course_reqs_path, selected_ucs)
+    # reuse the caller's group definitions instead of building an identical copy
+    if group_defs is None:
+        group_defs = load_uc_requirement_groups(course_reqs_path, selected_ucs)
 
     group_block_map: Dict[Tuple[str, str], List[List[str]]] = {}
     for uc, groups in group_defs.items():
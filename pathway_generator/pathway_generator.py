@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
-import json
-import os
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from pprint import pprint
 
 
-from major_checker import MajorRequirements, get_major_requirements
+from common import DEBUG, load_json
+from major_checker import MajorRequirements, get_major_requirements, get_articulation_filename
 from ge_checker import GE_Tracker
-from prereq_resolver import get_eligible_courses, load_prereq_data, add_missing_prereqs
+from prereq_resolver import get_eligible_courses, load_prereq_data, load_prereq_cnf, add_missing_prereqs
 from ge_helper import load_ge_lookup, build_ge_courses
-from unit_balancer import select_courses_for_term, prune_uc_to_cc_map
+from unit_balancer import select_courses_for_term, prune_uc_to_cc_map, build_equivalents_table
 # from elective_filler import fill_electives
 from plan_exporter import export_term_plan, save_plan_to_json
 
@@ -26,25 +27,25 @@ COURSE_REQS_FILE = PROJECT_ROOT / "scraping" / "files" / "course_reqs.json"
 
 
 # ─── 2) CC and UC options ─────────────────────────────────────────────────────
-ARTICULATION_FILES = {
-    "cabrillo":   "Cabrillo_College_articulation.json",
-    "chabot":     "Chabot_College_articulation.json",
-    "city_college_of_san_francisco": "City_College_Of_San_Francisco_articulation.json",
-    "cosumnes_river":               "Consumnes_River_College_articulation.json",
-    "de_anza":    "De_Anza_College_articulation.json",
-    "diablo_valley":"Diablo_Valley_College_articulation.json",
-    "folsom_lake":"Folsom_Lake_College_articulation.json",
-    "foothill":   "Foothill_College_articulation.json",
-    "la_city":    "Los_Angeles_City_College_articulation.json",
-    "los_angeles_city_college": "Los_Angeles_City_College_articulation.json",
-    "las_positas":"Las_Positas_College_articulation.json",
-    "los_angeles_pierce":"Los_Angeles_Pierce_College_articulation.json",
-    "miracosta":  "MiraCosta_College_articulation.json",
-    "mt_san_jacinto":"Mt_San_Jacinto_College_articulation.json",
-    "orange_coast":"Orange_Coast_College_articulation.json",
-    "palomar":    "Palomar_College_articulation.json",
-}
-SUPPORTED_CCS = list(ARTICULATION_FILES.keys())
+# articulation filenames are resolved by get_articulation_filename
+SUPPORTED_CCS = (
+    "cabrillo",
+    "chabot",
+    "city_college_of_san_francisco",
+    "cosumnes_river",
+    "de_anza",
+    "diablo_valley",
+    "folsom_lake",
+    "foothill",
+    "la_city",
+    "los_angeles_city_college",
+    "las_positas",
+    "los_angeles_pierce",
+    "miracosta",
+    "mt_san_jacinto",
+    "orange_coast",
+    "palomar",
+)
 SUPPORTED_UCS = ["UCSD", "UCLA", "UCI", "UCR", "UCSB", "UCD", "UCB", "UCSC", "UCM"]
 
 
@@ -118,10 +119,9 @@ def get_user_inputs():
 def build_file_paths(cc_id: str, uc_id: str):
     """Build all necessary file paths for the pathway generation."""
     # articulation file path
-    art_fname = ARTICULATION_FILES.get(cc_id)
-    if not art_fname:
+    if cc_id not in SUPPORTED_CCS:
         raise ValueError(f"No articulation file mapped for '{cc_id}'")
-    art_path = ARTICULATION_DIR / art_fname
+    art_path = ARTICULATION_DIR / get_articulation_filename(cc_id, ARTICULATION_DIR)
     if not art_path.exists():
         raise FileNotFoundError(f"Articulation file not found: {art_path}")
 
@@ -146,19 +146,36 @@ def build_file_paths(cc_id: str, uc_id: str):
     }
 
 
-def load_json(path):
-    with open(path, "r") as f:
-        return json.load(f)
 
+# ─── Core Pathway Generation ─────────────────────────────────────────────────
+@lru_cache(maxsize=None)
+def get_catalog_index(prereq_path: str):
+    """
+    Every CC course code plus its honors/base equivalents. Both depend only on
+    the CC's catalog, so all pathways for that CC share them (read-only).
+    """
+    course_codes = frozenset(load_prereq_data(prereq_path))
+    return course_codes, build_equivalents_table(course_codes)
+
+
+@lru_cache(maxsize=None)
+def get_major_map(cc_id: str, uc_tuple: tuple, art_path: str):
+    """
+    CC→UC articulation map for one (CC, UC list). It does not depend on the
+    GE pattern, so every pattern run for the same UCs shares it (read-only).
+    """
+    return MajorRequirements.get_cc_to_uc_map(cc_id, list(uc_tuple), art_path)
 
 
-# ─── Core Pathway Generation ─────────────────────────────────────────────────
 def generate_pathway(art_path, prereq_path, ge_path, major_path, cc_id: str, uc_list: list[str], ge_pattern: str):
+    # every loader below is cached, so repeat runs for a CC reuse the parsed data
     articulated = load_json(art_path)
-
     # load as a dict: courseCode -> metadata
-    prereqs = load_prereq_data(prereq_path)
-    ge_data = load_json(ge_path)
+    prereqs     = load_prereq_data(prereq_path)
+    # the same prereqs compiled to CNF for fast eligibility checks
+    prereq_cnf  = load_prereq_cnf(prereq_path)
+    all_cc_course_codes, equivalents = get_catalog_index(str(prereq_path))
+    ge_data     = load_json(ge_path)
     
     # Initialize the classes
     ge_tracker = GE_Tracker(ge_data)
@@ -183,26 +200,34 @@ def generate_pathway(art_path, prereq_path, ge_path, major_path, cc_id: str, uc_
     
 
     # 1) Candidate courses from major + GE 
-    major_map = MajorRequirements.get_cc_to_uc_map(cc_id, uc_list, art_path)
-    pprint(major_map)
-    uc_to_cc_map: dict[str, list[list[str]]] = {}
-    for uc, cmap in major_map.items():
+    major_map = get_major_map(cc_id, tuple(uc_list), str(art_path))
+    if DEBUG:
+        pprint(major_map)
+    uc_to_cc_map: dict[str, list[list[str]]] = defaultdict(list)
+    for cmap in major_map.values():
         for uc_course, blocks in cmap.items():
             # merge blocks for the same UC-course across campuses
-            uc_to_cc_map.setdefault(uc_course, []).extend(blocks)
-    print("🔍 uc_to_cc_map ready for pruning:")
-    pprint(uc_to_cc_map)
+            uc_to_cc_map[uc_course].extend(blocks)
+    if DEBUG:
+        print("🔍 uc_to_cc_map ready for pruning:")
+        pprint(uc_to_cc_map)
 
     major_cands = major_reqs.get_remaining_courses(completed, articulated)
     major_cands = add_missing_prereqs(major_cands, prereqs, completed)
     
     major_codes = sorted({ m['courseCode'] for m in major_cands })
-    pprint(major_codes)
+    if DEBUG:
+        pprint(major_codes)
+
 
+    prev_ge_keys = None
+    prereqs_met = set()   # completed only grows, so met prereqs stay met
+    ge_course_dicts = []
 
     while True:
         print(f"\n📘 Generating Term {term_num}…")
-        print(f"[DEBUG] full candidate list: {[c['courseCode'] for c in major_cands]}")
+        if DEBUG:
+            print(f"[DEBUG] full candidate list: {[c['courseCode'] for c in major_cands]}")
 
 
         # remaining_majors = [m for m in major_cands if m['courseCode'] not in completed]
@@ -215,7 +240,12 @@ def generate_pathway(art_path, prereq_path, ge_path, major_path, cc_id: str, uc_
         print(f"  Major remaining requirements: {list(major_cands)}")
         print(f"  GE remaining requirements: {list(ge_remaining.keys())}")
 
-        ge_course_dicts = build_ge_courses(ge_remaining, ge_lookup, unit_count=3)
+        # terms that leave the open GE areas unchanged reuse last term's dicts
+        # (nothing downstream mutates them)
+        ge_keys = tuple(ge_remaining)
+        if ge_keys != prev_ge_keys:
+            ge_course_dicts = build_ge_courses(ge_remaining, ge_lookup, unit_count=3)
+            prev_ge_keys = ge_keys
         
         
         # 2) Prereq filter: only try the courses we still need
@@ -223,29 +253,26 @@ def generate_pathway(art_path, prereq_path, ge_path, major_path, cc_id: str, uc_
         eligible = get_eligible_courses(
             completed,
             major_cands,
-            prereqs
+            prereqs,
+            satisfied_cache=prereqs_met,
+            compiled=prereq_cnf
         )
 
 
         # 3) Build eligibility list
-        eligible_course_dicts = [
-            {
-                'courseCode': e['courseCode'],
-                'units':      e['units']
-            }
-            for e in eligible
-        ]
-
-        all_cc_course_codes = set(prereqs.keys())
-        total_eligible = eligible_course_dicts + ge_course_dicts
-        print(f"Total Eligible: {total_eligible}")
+        # get_eligible_courses already returns fresh {courseCode, units} dicts
+        # and the balancer never mutates them, so no per-term copy is needed.
+        total_eligible = eligible + ge_course_dicts
+        if DEBUG:
+            print(f"Total Eligible: {total_eligible}")
         # 4) Balance units
         selected, units, pruned_codes = select_courses_for_term(
             total_eligible,
             completed,
             uc_to_cc_map,
             all_cc_course_codes, 
-            MAX_UNITS
+            MAX_UNITS,
+            equivalents=equivalents
         )
         if pruned_codes:
             before = len(major_cands)
@@ -254,7 +281,8 @@ def generate_pathway(art_path, prereq_path, ge_path, major_path, cc_id: str, uc_
                 if m['courseCode'] not in pruned_codes
             ]
             after = len(major_cands)
-            print(f"[DEBUG] dropped {before - after} OR‐courses: {pruned_codes}")
+            if DEBUG:
+                print(f"[DEBUG] dropped {before - after} OR‐courses: {pruned_codes}")
 
         if not selected:
             break
@@ -265,13 +293,12 @@ def generate_pathway(art_path, prereq_path, ge_path, major_path, cc_id: str, uc_
         #     selected, units = fill_electives(selected, units, MAX_UNITS)
 
         # 6) Update GE‐tracker state (all major completed marking is done in the balancer)
-        for course in selected:
-            code = course["courseCode"]
-            if "reqIds" in course:
-                for req in course["reqIds"]:
-                    ge_tracker.add_completed_course(code, req)
-            else:
-                ge_tracker.add_completed_course(code, course.get("tag", code))
+        ge_tracker.add_completed_courses(
+            (course["courseCode"], req)
+            for course in selected
+            for req in (course["reqIds"] if "reqIds" in course
+                        else [course.get("tag", course["courseCode"])])
+        )
 
         # 7) Record this term
         export_term_plan(f"Term {term_num}", selected, pathway)
@@ -1,4 +1,6 @@
-import json
+import os
+
+from common import dump_json_bytes
 
 def export_term_plan(term_name, selected_courses, output_plan):
     """
@@ -38,6 +40,17 @@ def export_term_plan(term_name, selected_courses, output_plan):
     output_plan.append(term_entry)
 
 
+def _atomic_write_bytes(path, data):
+    """
+    Write data next to path and rename it into place, so a crash mid-write
+    never leaves a truncated plan behind.
+    """
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
 def save_plan_to_json(output_plan, filename="output_pathway.json"):
     """
     Saves the full plan to a JSON file.
@@ -49,8 +62,7 @@ def save_plan_to_json(output_plan, filename="output_pathway.json"):
     Returns:
         None
     """
-    with open(filename, "w") as f:
-        json.dump(output_plan, f, indent=2)
+    _atomic_write_bytes(filename, dump_json_bytes(output_plan))
     print(f"Plan saved to {filename}")
 
 
@@ -1,11 +1,93 @@
-import json
+import sys
+from functools import lru_cache
+
+from common import DEBUG, load_json
 
 def load_prereq_data(json_path):
-    """Load JSON prereq data from file."""
-    with open(json_path, "r") as f:
-        data = json.load(f)
-    # Convert list to dict keyed by courseCode for quick lookup
-    return {course["courseCode"]: course for course in data}
+    """
+    Load JSON prereq data from file. Each file is parsed once per process;
+    the returned dict is shared and must not be modified.
+    """
+    return _load_prereq_data_cached(str(json_path))
+
+@lru_cache(maxsize=None)
+def _load_prereq_data_cached(json_path):
+    # Convert list to dict keyed by courseCode for quick lookup. Codes are
+    # interned: they are compared in set/dict lookups every term.
+    return {sys.intern(course["courseCode"]): course for course in load_json(json_path)}
+
+# An OR of ANDs can blow up when distributed into CNF; past this many clauses
+# a course keeps using the recursive checker instead.
+MAX_CNF_CLAUSES = 64
+
+def load_prereq_cnf(json_path):
+    """
+    courseCode -> compiled prereqs (see compile_prereqs) for a prereq file.
+    Compiled once per file; the returned dict is shared and must not be modified.
+    """
+    return _load_prereq_cnf_cached(str(json_path))
+
+@lru_cache(maxsize=None)
+def _load_prereq_cnf_cached(json_path):
+    prereqs = _load_prereq_data_cached(json_path)
+    return {code: compile_prereqs(course.get("prerequisites")) for code, course in prereqs.items()}
+
+def compile_prereqs(raw):
+    """
+    Compile a course's "prerequisites" value into CNF: a list of OR-clauses
+    (frozensets of course codes), met when every clause shares a code with
+    completed. [] is always met; a frozenset() clause is never met.
+    Returns None when the shape can't be compiled (the caller falls back to
+    course_prereqs_satisfied). Mirrors course_prereqs_satisfied exactly.
+    """
+    if raw is None or raw == []:
+        return []
+    if isinstance(raw, dict):
+        return _block_to_cnf(raw)
+    if isinstance(raw, list):
+        if not all(isinstance(item, str) for item in raw):
+            return None
+        if any(';' in item for item in raw):
+            # AND of every ';'-separated part
+            return [frozenset((part.strip(),)) for group in raw for part in group.split(';')]
+        # OR of the listed codes
+        return [frozenset(raw)]
+    # Unknown format - assume no prereqs
+    return []
+
+def _block_to_cnf(block):
+    """CNF for one prereq_block_satisfied block, or None if it can't be compiled."""
+    if isinstance(block, str):
+        return [frozenset((block,))]
+    if not block:
+        return []
+    if isinstance(block, dict) and "and" in block:
+        if not isinstance(block["and"], list):
+            return None
+        cnf = []
+        for sub in block["and"]:
+            sub_cnf = _block_to_cnf(sub)
+            if sub_cnf is None:
+                return None
+            cnf.extend(sub_cnf)
+        return cnf
+    if isinstance(block, dict) and "or" in block:
+        if not isinstance(block["or"], list):
+            return None
+        cnf = [frozenset()]    # an empty OR is never met
+        for sub in block["or"]:
+            sub_cnf = _block_to_cnf(sub)
+            if sub_cnf is None:
+                return None
+            # (a1 ∧ a2) ∨ (b1 ∧ b2) == (a1 ∨ b1) ∧ (a1 ∨ b2) ∧ (a2 ∨ b1) ∧ (a2 ∨ b2)
+            cnf = [a | b for a in cnf for b in sub_cnf]
+            if len(cnf) > MAX_CNF_CLAUSES:
+                return None
+        return cnf
+    return [frozenset()]
+
+def cnf_satisfied(cnf, completed_courses):
+    return all(not clause.isdisjoint(completed_courses) for clause in cnf)
 
 def add_missing_prereqs(major_cands, prereqs, completed=None, default_units=3):
         if completed is None:
@@ -101,20 +183,45 @@ def course_prereqs_satisfied(course, completed_courses):
         # Unknown format - assume no prereqs
         return True
 
-def get_eligible_courses(completed_courses, major_cands, prereqs, default_units=3):
+def get_eligible_courses(completed_courses, major_cands, prereqs, default_units=3,
+                         satisfied_cache=None, compiled=None):
+    """
+    satisfied_cache (optional set) remembers codes whose prereqs were met.
+    Only pass one while completed_courses only ever grows (as in a single
+    pathway run): a met prereq then stays met and is never re-walked.
+    compiled (optional, from load_prereq_cnf) replaces the recursive
+    prereq walk with set checks for every course it could compile.
+    """
     eligible = []
+    # sorted once per call (and only for the trace), not once per candidate
+    completed_sorted = sorted(completed_courses) if DEBUG else None
     for cand in major_cands:
         code = cand["courseCode"]
         raw_pr = prereqs.get(code, {}).get("prerequisites", None)
-        print(f"[ELIGIBILITY] Checking {code!r}: prereqs={raw_pr!r}, completed={sorted(completed_courses)}")
+        if DEBUG:
+            print(f"[ELIGIBILITY] Checking {code!r}: prereqs={raw_pr!r}, completed={completed_sorted}")
 
         if code in completed_courses:
-            print(f"   → skip {code}: already completed")
+            if DEBUG:
+                print(f"   → skip {code}: already completed")
             continue
 
-        if course_prereqs_satisfied({"prerequisites": raw_pr}, completed_courses):
-            print(f"   ✔ {code} is eligible")
+        if satisfied_cache is not None and code in satisfied_cache:
+            met = True
+        else:
+            cnf = compiled.get(code) if compiled is not None else None
+            if cnf is not None:
+                met = cnf_satisfied(cnf, completed_courses)
+            else:
+                met = course_prereqs_satisfied({"prerequisites": raw_pr}, completed_courses)
+            if met and satisfied_cache is not None:
+                satisfied_cache.add(code)
+
+        if met:
+            if DEBUG:
+                print(f"   ✔ {code} is eligible")
             eligible.append({"courseCode": code, "units": cand.get("units", default_units)})
         else:
-            print(f"   ✖ {code} blocked by prereqs")
+            if DEBUG:
+                print(f"   ✖ {code} blocked by prereqs")
     return eligible
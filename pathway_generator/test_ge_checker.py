@@ -1,33 +1,18 @@
-import json
-from ge_checker import GE_Tracker
-
-# Load GE structure JSON
-with open("../prerequisites/ge_reqs.json") as f:
-    ge_data = json.load(f)
+from collections import Counter
+from pathlib import Path
 
-# Initialize tracker and load the pattern requirements
-ge = GE_Tracker(ge_data)
-ge.load_pattern("IGETC")
-ge.load_pattern("7CoursePattern")
-
-# Add completed courses for IGETC (same as before)
-ge.add_completed_course("English Composition", ["IG_1A"])
-ge.add_completed_course("English Composition", ["IG_1A"]) # if duplicate courses are created it doesn't fulfill the requirement
-ge.add_completed_course("Humanities", ["IG_3B"])
-ge.add_completed_course("Humanities", ["IG_3B"]) # duplicate because of the either course requirement in IGETC 
-ge.add_completed_course("Biological Science", ["IG_Biological"])
-ge.add_completed_course("Laboratory Science (in either Physical or Biological)", ["IG_Lab"])
+from common import load_json
+from ge_checker import GE_Tracker
 
+GE_REQS_PATH = Path(__file__).resolve().parent.parent / "prerequisites" / "ge_reqs.json"
 
-# Add some completed courses for 7CoursePattern to test
-ge.add_completed_course("Written Communication Course 1", ["GE_WrittenComm"])
-ge.add_completed_course("Arts & Humanities Course 1", ["GE_ArtsHum"])
-# no math course added, so 1 remaining there
-# no general subcategories added so taken counts should be zero
+def _remaining(remaining, key):
+    """courses_remaining for key, or 0 if that requirement is already met."""
+    return (remaining.get(key) or {}).get("courses_remaining", 0)
 
-def print_remaining_requirements(pattern_id):
+def print_remaining_requirements(ge, pattern):
+    pattern_id = pattern["patternId"]
     remaining = ge.get_remaining_requirements(pattern_id)
-    pattern = next(p for p in ge_data["requirementPatterns"] if p["patternId"] == pattern_id)
 
     print(f"Remaining {pattern['patternName']} Requirements:")
 
@@ -36,23 +21,17 @@ def print_remaining_requirements(pattern_id):
 
         if "subRequirements" in req and req["subRequirements"]:
             if pattern_id == "IGETC":
-                parent_remaining = 0
-                for sub in req["subRequirements"]:
-                    sub_id = sub["reqId"]
-                    if sub_id in remaining:
-                        parent_remaining += remaining[sub_id]["courses_remaining"]
+                sub_ids = [sub["reqId"] for sub in req["subRequirements"]]
+                parent_remaining = sum(_remaining(remaining, sub_id) for sub_id in sub_ids)
 
                 leftover_key = f"{req_id}_Leftover"
-                leftover_courses = 0
-                if leftover_key in remaining:
-                    leftover_courses = remaining[leftover_key]["courses_remaining"]
-                    parent_remaining += leftover_courses
+                parent_remaining += _remaining(remaining, leftover_key)
 
                 print(f"- {req['name']} ({parent_remaining} course(s)):")
 
                 for sub in req["subRequirements"]:
                     sub_id = sub["reqId"]
-                    courses_left = remaining[sub_id]["courses_remaining"] if sub_id in remaining else 0
+                    courses_left = _remaining(remaining, sub_id)
                     print(f"  - {sub['name']} ({courses_left} course(s))")
 
                 # Always print leftover OR line, even if 0 remaining
@@ -61,36 +40,68 @@ def print_remaining_requirements(pattern_id):
                     print(f"  - {leftover_info['name']} ({leftover_info['courses_remaining']} course(s))")
 
             elif pattern_id == "7CoursePattern" and req_id == "GE_General":
-                parent_remaining = remaining.get(req_id, {}).get("courses_remaining", 0)
+                parent_remaining = _remaining(remaining, req_id)
                 print(f"- {req['name']} ({parent_remaining} course(s)):")
 
+                # count every tag once instead of rescanning completed courses per subcategory
+                tag_counts = Counter(tag for c in ge.completed_courses for tag in set(c.get("tags", ())))
                 for sub in req["subRequirements"]:
                     sub_id = sub["reqId"]
-                    taken_count = sum(1 for c in ge.completed_courses if sub_id in c.get("tags", []))
+                    taken_count = tag_counts[sub_id]
                     print(f"  - {sub['name']} (taken {taken_count} course(s))")
 
             else:
-                parent_remaining = 0
-                for sub in req["subRequirements"]:
-                    sub_id = sub["reqId"]
-                    if sub_id in remaining:
-                        parent_remaining += remaining[sub_id]["courses_remaining"]
+                sub_ids = [sub["reqId"] for sub in req["subRequirements"]]
+                parent_remaining = sum(_remaining(remaining, sub_id) for sub_id in sub_ids)
                 print(f"- {req['name']} ({parent_remaining} course(s)):")
 
                 for sub in req["subRequirements"]:
                     sub_id = sub["reqId"]
-                    courses_left = remaining[sub_id]["courses_remaining"] if sub_id in remaining else 0
+                    courses_left = _remaining(remaining, sub_id)
                     print(f"  - {sub['name']} ({courses_left} course(s))")
 
         else:
-            courses_left = remaining[req_id]["courses_remaining"] if req_id in remaining else 0
+            courses_left = _remaining(remaining, req_id)
             print(f"- {req['name']} ({courses_left} course(s))")
 
     print(f"Is {pattern['patternName']} fulfilled? {ge.is_fulfilled(pattern_id)}\n")
 
 
-# Print IGETC remaining
-print_remaining_requirements("IGETC")
+def main():
+    # Load GE structure JSON (same cached loader the pathway generator uses)
+    ge_data = load_json(GE_REQS_PATH)
+    patterns_by_id = {p["patternId"]: p for p in ge_data["requirementPatterns"]}
+
+    # Initialize tracker and load the pattern requirements
+    ge = GE_Tracker(ge_data)
+    ge.load_pattern("IGETC")
+    ge.load_pattern("7CoursePattern")
+
+    # Add completed courses for IGETC (same as before)
+    ge.add_completed_courses([
+        ("English Composition", ["IG_1A"]),
+        ("English Composition", ["IG_1A"]), # if duplicate courses are created it doesn't fulfill the requirement
+        ("Humanities", ["IG_3B"]),
+        ("Humanities", ["IG_3B"]), # duplicate because of the either course requirement in IGETC 
+        ("Biological Science", ["IG_Biological"]),
+        ("Laboratory Science (in either Physical or Biological)", ["IG_Lab"]),
+    ])
+
+
+    # Add some completed courses for 7CoursePattern to test
+    ge.add_completed_courses([
+        ("Written Communication Course 1", ["GE_WrittenComm"]),
+        ("Arts & Humanities Course 1", ["GE_ArtsHum"]),
+    ])
+    # no math course added, so 1 remaining there
+    # no general subcategories added so taken counts should be zero
+
+    # Print IGETC remaining
+    print_remaining_requirements(ge, patterns_by_id["IGETC"])
+
+    # Print 7-Course Pattern remaining
+    print_remaining_requirements(ge, patterns_by_id["7CoursePattern"])
+
 
-# Print 7-Course Pattern remaining
-print_remaining_requirements("7CoursePattern")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
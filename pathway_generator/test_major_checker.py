@@ -8,11 +8,11 @@ and get_cc_to_uc_map from major_checker.py to list:
   2) the mapping of UC courses to CC courses with clear breaks per UC
 """
 
-import json
 import sys
 from pathlib import Path
 
-from major_checker import get_major_requirements, get_cc_to_uc_map
+from common import load_json
+from major_checker import MajorRequirements, get_articulation_filename, get_major_requirements
 
 # ─── 1) Locate directories ────────────────────────────────────────────────────
 SCRIPT_DIR       = Path(__file__).parent.resolve()  # .../pathway_generator
@@ -22,24 +22,28 @@ PREREQS_DIR      = PROJECT_ROOT / "prerequisites"
 COURSE_REQS_FILE = PROJECT_ROOT / "scraping" / "files" / "course_reqs.json"
 
 # ─── 2) CC and UC options ─────────────────────────────────────────────────────
-ARTICULATION_FILES = {
-    "cabrillo":   "Cabrillo_College_articulation.json",
-    "chabot":     "Chabot_College_articulation.json",
-    "city_college_of_san_francisco": "City_College_Of_San_Francisco_articulation.json",
-    "consumes_river":               "Consumnes_River_College_articulation.json",
-    "de_anza":    "De_Anza_College_articulation.json",
-    "diablo_valley":"Diablo_Valley_College_articulation.json",
-    "folsom_lake":"Folsom_Lake_College_articulation.json",
-    "foothill":   "Foothill_College_articulation.json",
-    "la_city":    "Los_Angeles_City_College_articulation.json",
-    "las_positas":"Las_Positas_College_articulation.json",
-    "los_angeles_pierce":"Los_Angeles_Pierce_College_articulation.json",
-    "miracosta":  "MiraCosta_College_articulation.json",
-    "mt_san_jacinto":"Mt_San_Jacinto_College_articulation.json",
-    "orange_coast":"Orange_Coast_College_articulation.json",
-    "palomar":    "Palomar_College_articulation.json",
+# articulation filenames are resolved by get_articulation_filename, as in pathway_generator
+SUPPORTED_CCS = (
+    "cabrillo",
+    "chabot",
+    "city_college_of_san_francisco",
+    "cosumnes_river",
+    "de_anza",
+    "diablo_valley",
+    "folsom_lake",
+    "foothill",
+    "la_city",
+    "las_positas",
+    "los_angeles_pierce",
+    "miracosta",
+    "mt_san_jacinto",
+    "orange_coast",
+    "palomar",
+)
+# joined once here rather than on every build_file_paths call
+ARTICULATION_PATHS = {
+    cc: ARTICULATION_DIR / get_articulation_filename(cc, ARTICULATION_DIR) for cc in SUPPORTED_CCS
 }
-SUPPORTED_CCS = list(ARTICULATION_FILES.keys())
 SUPPORTED_UCS = ["UCSD", "UCLA", "UCI", "UCR", "UCSB", "UCD", "UCB", "UCSC", "UCM"]
 
 
@@ -75,10 +79,9 @@ def get_user_inputs():
 
 def build_file_paths(cc_id: str):
     # articulation file path
-    art_fname = ARTICULATION_FILES.get(cc_id)
-    if not art_fname:
+    art_path = ARTICULATION_PATHS.get(cc_id)
+    if art_path is None:
         raise ValueError(f"No articulation file mapped for '{cc_id}'")
-    art_path = ARTICULATION_DIR / art_fname
     if not art_path.exists():
         raise FileNotFoundError(f"Articulation file not found: {art_path}")
 
@@ -94,10 +97,9 @@ def main():
         print(f"✖ {e}")
         sys.exit(1)
 
-    # load articulation JSON
-    data = json.load(open(art_path, 'r', encoding='utf-8'))
-    cc_key = next(iter(data.keys()))
-    articulated = data[cc_key]
+    # load articulation JSON (cached, orjson when installed; no leaked handle)
+    data = load_json(art_path)
+    cc_key, articulated = next(iter(data.items()))
 
     print(f"\n▶ Using articulation: {art_path.name}")
     print(f"▶ CC JSON key: '{cc_key}'")
@@ -116,10 +118,11 @@ def main():
         print(f"  • {c['courseCode']:<10} {c['units']:>2} units   [{c['tag']}]  ")
 
     # 2) Test get_cc_to_uc_map with formatted breaks
-    uc_map = get_cc_to_uc_map(
-        cc_name=cc_key,
+    # same call pathway_generator makes: short CC ID + the articulation file
+    uc_map = MajorRequirements.get_cc_to_uc_map(
+        cc_name=cc_id,
         selected_ucs=uc_keys,
-        articulation_dir=ARTICULATION_DIR
+        articulation_dir=art_path
     )
     print(f"\n===== CC → UC Articulation Map for {uc_keys} =====")
     for uc in uc_keys:
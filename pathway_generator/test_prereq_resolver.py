@@ -1,8 +1,54 @@
 # test_prereq_resolver.py
 
-from prereq_resolver import get_eligible_courses, load_prereq_data
+from itertools import combinations
+
+from prereq_resolver import (
+    MAX_CNF_CLAUSES, cnf_satisfied, compile_prereqs, course_prereqs_satisfied,
+    get_eligible_courses, load_prereq_data,
+)
+
+# Prereq shapes compile_prereqs must agree with course_prereqs_satisfied on
+COMPILABLE_SHAPES = [
+    None,
+    [],
+    {},
+    {"or": []},                                   # empty OR: never met
+    {"and": []},                                  # empty AND: always met
+    {"and": [{"or": []}, "MATH 1"]},
+    {"or": [{}, "MATH 1"]},
+    {"or": [{"and": ["MATH 1", "MATH 2"]}, {"and": ["CS 1", "CS 2"]}]},
+    {"and": ["MATH 1", {"or": ["CS 1", {"and": ["CS 2", "MATH 2"]}]}]},
+    {"unknown": ["MATH 1"]},                      # unknown block: never met
+    ["MATH 1", "CS 1"],                           # list: OR of the codes
+    ["MATH 1;MATH 2", "CS 1"],                    # ';' list: AND of every part
+    "MATH 1",                                     # unknown format: no prereqs
+]
+# Shapes that must fall back to the recursive checker
+UNCOMPILABLE_SHAPES = [
+    ["MATH 1", {"or": ["CS 1"]}],                 # list with a non-string entry
+    {"and": "MATH 1"},
+    {"or": [{"and": [f"A{i}", f"B{i}", f"C{i}"]} for i in range(5)]},  # > MAX_CNF_CLAUSES
+]
+CODES = ["MATH 1", "MATH 2", "CS 1", "CS 2"]
+
+def check_compiled_prereqs():
+    """compile_prereqs + cnf_satisfied must match course_prereqs_satisfied on every completed set."""
+    completed_sets = [set(combo) for n in range(len(CODES) + 1) for combo in combinations(CODES, n)]
+    for shape in COMPILABLE_SHAPES:
+        cnf = compile_prereqs(shape)
+        assert cnf is not None, f"{shape!r} should compile"
+        assert len(cnf) <= MAX_CNF_CLAUSES
+        for completed in completed_sets:
+            expected = course_prereqs_satisfied({"prerequisites": shape}, completed)
+            assert cnf_satisfied(cnf, completed) == expected, (shape, completed)
+    for shape in UNCOMPILABLE_SHAPES:
+        assert compile_prereqs(shape) is None, f"{shape!r} should not compile"
+    print(f"Compiled prereqs match the recursive checker on {len(COMPILABLE_SHAPES)} shapes "
+          f"x {len(completed_sets)} completed sets\n")
 
 def main():
+    check_compiled_prereqs()
+
     # TODO: Replace this path with the actual path to your JSON prereqs file
     prereq_json_path = "/Users/yasminkabir/GitHub/transfer-agreements-analysis-3/prerequisites/cabrillo_college_prereqs.json"
 
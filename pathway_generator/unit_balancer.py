@@ -1,3 +1,5 @@
+from common import DEBUG
+
 #This one prioritizes Major courses and then GE courses
 
 # def select_courses_for_term(eligible_courses, completed_courses=None, fulfilled_ge_ids=None, max_units=20):
@@ -68,7 +70,7 @@ def prune_uc_to_cc_map(
     for uc_course, blocks in list(uc_to_cc_map.items()):
         for block in blocks:
             # If this block is now fully taken…
-            if new_course in block and set(block).issubset(completed):
+            if new_course in block and completed.issuperset(block):
                 # 1) Requirement satisfied ⇒ drop the UC-course entirely
                 del uc_to_cc_map[uc_course]
 
@@ -80,9 +82,23 @@ def prune_uc_to_cc_map(
 
 
 
+def honors_equivalents(code, all_cc_course_codes):
+    """Other codes in the catalog that are the same course as code, honors or not."""
+    base = code.rstrip('H')    # e.g. "MATH 1AH" -> "MATH 1A", or "MATH 1A" -> "MATH 1A"
+    hon  = base + 'H'          # "MATH 1AH"
+    return tuple(eq for eq in (base, hon) if eq != code and eq in all_cc_course_codes)
+
+
+def build_equivalents_table(all_cc_course_codes):
+    """honors_equivalents for every catalog code, computed once per CC."""
+    return {code: honors_equivalents(code, all_cc_course_codes) for code in all_cc_course_codes}
+
+
 # unit_balancer.py
-def select_courses_for_term(candidates, completed, uc_to_cc_map, all_cc_course_codes, MAX_UNITS=20):
-    print(f"\n[BALANCER] start term, completed={sorted(completed)}, map keys={list(uc_to_cc_map.keys())}")
+def select_courses_for_term(candidates, completed, uc_to_cc_map, all_cc_course_codes, MAX_UNITS=20,
+                            equivalents=None):
+    if DEBUG:
+        print(f"\n[BALANCER] start term, completed={sorted(completed)}, map keys={list(uc_to_cc_map.keys())}")
     remaining_ges    = [c for c in candidates if 'reqIds' in c]
     remaining_majors = [c for c in candidates if 'reqIds' not in c]
 
@@ -93,9 +109,11 @@ def select_courses_for_term(candidates, completed, uc_to_cc_map, all_cc_course_c
     # STEP 1: pick one GE
     if remaining_ges:
         ge = remaining_ges.pop(0)
-        print(f"[BALANCER] considering GE {ge['courseCode']} ({ge['units']}u)")
+        if DEBUG:
+            print(f"[BALANCER] considering GE {ge['courseCode']} ({ge['units']}u)")
         if total_units + ge['units'] <= MAX_UNITS:
-            print(f"   → selecting GE {ge['courseCode']}")
+            if DEBUG:
+                print(f"   → selecting GE {ge['courseCode']}")
             selected.append(ge)
             total_units += ge['units']
             completed.add(ge['courseCode'])
@@ -103,16 +121,20 @@ def select_courses_for_term(candidates, completed, uc_to_cc_map, all_cc_course_c
     # STEP 2: majors
     for m in remaining_majors:
         code, units = m['courseCode'], m['units']
-        print(f"[BALANCER] considering MAJOR {code} ({units}u)")
+        if DEBUG:
+            print(f"[BALANCER] considering MAJOR {code} ({units}u)")
         if code in completed:
-            print("   → skip: already completed")
+            if DEBUG:
+                print("   → skip: already completed")
             continue
         if total_units + units > MAX_UNITS:
-            print("   → skip: unit cap")
+            if DEBUG:
+                print("   → skip: unit cap")
             continue
 
         # pick it
-        print("   → selecting")
+        if DEBUG:
+            print("   → selecting")
         selected.append(m)
         total_units += units
         completed.add(code)
@@ -121,17 +143,21 @@ def select_courses_for_term(candidates, completed, uc_to_cc_map, all_cc_course_c
 
         
         # Whenever you complete a base course, complete its honors variant too (and vice versa)
-        base = code.rstrip('H')    # e.g. "MATH 1AH" -> "MATH 1A", or "MATH 1A" -> "MATH 1A"
-        hon  = base + 'H'          # "MATH 1AH"
-        for eq in (base, hon):
-            if eq != code and eq in all_cc_course_codes:
+        eqs = equivalents.get(code) if equivalents is not None else None
+        if eqs is None:
+            eqs = honors_equivalents(code, all_cc_course_codes)
+        for eq in eqs:
+            if DEBUG:
                 print(f"[EQUIV] also marking equivalent {eq} complete")
-                completed.add(eq)
-
-        # now prune any UC requirement we’ve satisfied
-        for uc_course, blocks in list(uc_to_cc_map.items()):
-            if any(set(block).issubset(completed) for block in blocks):
-                print(f"   [PRUNE] requirement {uc_course} satisfied; dropping it")
+            completed.add(eq)
+
+        # now prune any UC requirement we’ve satisfied (no snapshot needed:
+        # we stop iterating as soon as an entry is deleted)
+        for uc_course, blocks in uc_to_cc_map.items():
+            # issuperset walks the block list directly: no throwaway set per block
+            if any(completed.issuperset(block) for block in blocks):
+                if DEBUG:
+                    print(f"   [PRUNE] requirement {uc_course} satisfied; dropping it")
                 del uc_to_cc_map[uc_course]
 
                 # collect *every* CC‐course in those blocks for pruning
@@ -140,23 +166,28 @@ def select_courses_for_term(candidates, completed, uc_to_cc_map, all_cc_course_c
                         # if it's not the one we just completed, mark it as pruned
                         if cc_code not in completed:
                             pruned_codes.add(cc_code)
-                            print(f"      [PRUNE] will drop CC‐course {cc_code}")
+                            if DEBUG:
+                                print(f"      [PRUNE] will drop CC‐course {cc_code}")
                 break
 
     # STEP 3: more GEs
     for ge in remaining_ges:
         code, units = ge['courseCode'], ge['units']
-        print(f"[BALANCER] reconsider GE {code} ({units}u)")
+        if DEBUG:
+            print(f"[BALANCER] reconsider GE {code} ({units}u)")
         if code in completed:
-            print("   → skip: already completed")
+            if DEBUG:
+                print("   → skip: already completed")
             continue
         if total_units + units <= MAX_UNITS:
-            print("   → selecting GE")
+            if DEBUG:
+                print("   → selecting GE")
             selected.append(ge)
             total_units += units
             completed.add(code)
 
-    print(f"[BALANCER] end term: selected={[c['courseCode'] for c in selected]}, total_units={total_units}")
+    if DEBUG:
+        print(f"[BALANCER] end term: selected={[c['courseCode'] for c in selected]}, total_units={total_units}")
     return selected, total_units, pruned_codes
 
 
@@ -0,0 +1,5 @@
+"""
+Output settings shared by the scraping scripts.
+"""
+
+WRITE_BUFFER_SIZE = 1 << 20  # one large buffer per CC file instead of many small writes
@@ -10,6 +10,7 @@ import os
 import csv
 
 from files.course_reqs import UC_REQUIREMENTS
+from io_config import WRITE_BUFFER_SIZE
 
 # ----- UC name → abbreviation mapping -----------------------------
 UC_ABBREVIATIONS = {
@@ -110,21 +111,15 @@ def save_filtered_csv(cc_name, rows):
         + [f"Courses Group {i+1}" for i in range(max_or)]
     )
 
-    with open(out_path, "w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=headers)
-        writer.writeheader()
-
-        for r in rows:
-            out = {
-                "UC Name": r["UC Name"],
-                "Group ID": r["Group ID"],
-                "Set ID": r["Set ID"],
-                "Num Required": r["Num Required"],
-                "Receiving": r["Receiving"],
-            }
-            for i, val in enumerate(r["OR Groups"]):
-                out[f"Courses Group {i+1}"] = val
-            writer.writerow(out)
+    with open(out_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as fh:
+        writer = csv.writer(fh)
+        writer.writerow(headers)
+        writer.writerows(
+            [r["UC Name"], r["Group ID"], r["Set ID"], r["Num Required"], r["Receiving"]]
+            + r["OR Groups"]
+            + [""] * (max_or - len(r["OR Groups"]))
+            for r in rows
+        )
 
     print(f"✅  Saved → {out_path}")
 
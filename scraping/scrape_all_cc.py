@@ -1,5 +1,4 @@
 import os
-import csv
 import time
 import traceback
 import scraping  # Importing existing scraping functions
@@ -7,6 +6,8 @@ import scraping  # Importing existing scraping functions
 # Directories
 AGREEMENTS_DIR = "cc_agreements"
 RESULTS_DIR = "results"
+# Full tracebacks for every failed scrape attempt are only printed on request
+PRINT_TRACEBACKS = os.environ.get("SCRAPE_DEBUG") == "1"
 os.makedirs(RESULTS_DIR, exist_ok=True)
 
 def find_agreement_urls(cc_name):
@@ -37,7 +38,8 @@ def scrape_uc_data(uc_name, url):
             return scraping.parse_articulations(html)
         except Exception as e:
             print(f"❌ Error scraping {uc_name} (Attempt {attempt+1}/3): {e}")
-            traceback.print_exc()
+            if PRINT_TRACEBACKS:
+                traceback.print_exc()
             time.sleep(5)
     print(f"❌ Failed to scrape {uc_name} after 3 retries.")
     return None
@@ -55,21 +57,10 @@ def write_csv(cc_name, all_rows):
     safe_cc_name = cc_name.replace(" ", "_").replace("/", "-")
     csv_path = os.path.join(RESULTS_DIR, f"{safe_cc_name}_allUC.csv")
 
-    max_or_columns = max(len(row["OR Groups"]) for row in all_rows)
-
-    headers = ["UC Campus", "CC", "UC Course Requirement"]
-    for i in range(1, max_or_columns + 1):
-        headers.append(f"Courses Group {i}")
-
-    with open(csv_path, "w", encoding="utf-8", newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=headers)
-        writer.writeheader()
-        for row in all_rows:
-            row_data = dict(row)
-            or_groups = row_data.pop("OR Groups")
-            for i in range(max_or_columns):
-                row_data[f"Courses Group {i+1}"] = or_groups[i] if i < len(or_groups) else ""
-            writer.writerow(row_data)
+    scraping.write_uc_rows_csv(csv_path, [
+        (row["UC Campus"], row["CC"], row["UC Course Requirement"], row["OR Groups"])
+        for row in all_rows
+    ])
 
     print(f"✅ CSV saved: {csv_path}")
 
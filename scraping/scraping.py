@@ -10,6 +10,8 @@ from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
 import logging
 
+from io_config import WRITE_BUFFER_SIZE
+
 # where your per‐CC URL lists live:
 CC_AGREEMENTS_DIR = "cc_agreements"
 
@@ -154,28 +156,30 @@ def find_cc_urls(cc_name):
                 pairs.append((uc_name.strip(), url))
     return pairs
 
+def write_uc_rows_csv(out_path, rows):
+    """
+    Write (uc_campus, cc, uc_requirement, or_groups) rows to out_path,
+    padding the "Courses Group N" columns out to the widest row.
+    """
+    max_groups = max((len(groups) for _, _, _, groups in rows), default=0)
+    headers = ["UC Campus","CC","UC Course Requirement"] + [f"Courses Group {i}" for i in range(1, max_groups+1)]
+
+    with open(out_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(
+            [uc, cc, requirement] + list(groups) + [""] * (max_groups - len(groups))
+            for uc, cc, requirement, groups in rows
+        )
+
 def write_csv(cc_name, rows):
     safe = cc_name.replace(" ", "_")
     out_path = os.path.join(RESULTS_DIR, f"{safe}_allUC.csv")
 
-    max_groups = max(len(r["OR Groups"]) for r in rows) if rows else 0
-    headers = ["UC Campus","CC","UC Course Requirement"] + [f"Courses Group {i}" for i in range(1, max_groups+1)]
-
-    with open(out_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        for rec in rows:
-            base = {
-                "UC Campus": rec["UC Campus"],
-                "CC": cc_name,
-                "UC Course Requirement": "; ".join(rec["Receiving"])
-            }
-            for i, grp in enumerate(rec["OR Groups"], start=1):
-                base[f"Courses Group {i}"] = grp
-            # ensure all headers exist
-            for h in headers:
-                base.setdefault(h, "")
-            writer.writerow(base)
+    write_uc_rows_csv(out_path, [
+        (rec["UC Campus"], cc_name, "; ".join(rec["Receiving"]), rec["OR Groups"])
+        for rec in rows
+    ])
 
     print(f"\n✅ Overwritten → {out_path}")
 